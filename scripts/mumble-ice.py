@@ -10,134 +10,384 @@ Protocol:
   Input:  {"id": "<id>", "method": "<method>", "params": {...}}
   Output: {"id": "<id>", "result": <value>}
           {"id": "<id>", "error": "<error message>"}
+  Batch:  [<request>, <request>, ...]  (one line, dispatched in order)
+       →  {"batch": [<output>, <output>, ...]}
   Ready:  {"ready": true}   (written once on successful ICE connect)
 
+  Requests are handled by a pool of worker threads sharing one ICE
+  connection, so responses may arrive out of order — match them by id.
+  Sub-requests within a batch always run in order on a single worker, and
+  setACL / updateRegistration / unregisterUser calls on the same channel or
+  user are applied in the order they were sent. Reads run in parallel.
+
 Environment vars (inherited from quad):
   MUMBLE_HOST         — Murmur host (Docker service name or IP)
   MUMBLE_ICE_PORT     — ICE port (default: 6502)
   MUMBLE_ICE_SECRET   — ICE write secret (ICESECRETWRITE value)
+  MUMBLE_ICE_WORKERS  — concurrent ICE calls in flight (default: 4)
 
 Required Python package: zeroc-ice (pip install zeroc-ice)
+Optional: orjson (pip install orjson) — faster JSON codec, falls back to json
 """
 
 import sys
 import json
 import os
+import queue
+import threading
 import traceback
-from pathlib import Path
+from collections.abc import Iterator
 
 import Ice
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: object) -> bytes:
+        # OPT_NON_STR_KEYS stringifies int dict keys, matching json.dumps
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
 # Load the Murmur slice at import time — Ice.loadSlice() compiles MumbleServer.ice
 # via slice2py (bundled with zeroc-ice) and registers the module globally.
-_SCRIPT_DIR = Path(__file__).parent
-Ice.loadSlice(str(_SCRIPT_DIR / 'MumbleServer.ice'))
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+Ice.loadSlice(os.path.join(_SCRIPT_DIR, 'MumbleServer.ice'))
 import MumbleServer  # noqa: E402 — must come after loadSlice
 
 
-def create_communicator(host: str, port: int, secret: str) -> Ice.Communicator:
-    """Create an ICE communicator with the write secret in the implicit context."""
+# UserInfo enum value → readable name (e.g. 0 → 'UserName'), built from the slice.
+# Ice.EnumBase exposes .value/.name only — it has no __int__.
+_USERINFO_NAMES = {e.value: e.name for e in MumbleServer.UserInfo._enumerators.values()}
+
+# Virtual server proxies, keyed by server ID — fetched once per sidecar lifetime
+_server_cache: dict[int, MumbleServer.ServerPrx] = {}
+
+# ICE request context carrying the write secret — built once in main() and
+# passed explicitly on every call instead of going through ImplicitContext
+_CTX: dict[str, str] = {}
+
+# Serializes stdout writes from worker threads so response lines never interleave
+_write_lock = threading.Lock()
+
+
+def create_communicator() -> Ice.Communicator:
+    """Create an ICE communicator (the write secret travels in _CTX per call)."""
     props = Ice.createProperties(sys.argv)
     # Reduce logging noise
     props.setProperty('Ice.Warn.Connections', '0')
-    props.setProperty('Ice.ACM.Client', '0')
-    # Enable implicit context so we can attach the ICE write secret
-    props.setProperty('Ice.ImplicitContext', 'Shared')
+    # Keep the single long-lived connection warm: heartbeat always (3 =
+    # HeartbeatAlways) and never close it for idleness, so an idle gap
+    # doesn't cost a full reconnect on the next call.
+    props.setProperty('Ice.ACM.Client.Timeout', '60')
+    props.setProperty('Ice.ACM.Client.Heartbeat', '3')
+    props.setProperty('Ice.ACM.Client.Close', '0')
 
     init_data = Ice.InitializationData()
     init_data.properties = props
-    communicator = Ice.initialize(init_data)
+    return Ice.initialize(init_data)
 
-    if secret:
-        communicator.getImplicitContext().put('secret', secret)
 
-    return communicator
+def get_server(meta: MumbleServer.MetaPrx, server_id: int) -> MumbleServer.ServerPrx:
+    """Return the proxy for a virtual server, memoized per server ID."""
+    server = _server_cache.get(server_id)
+    if server is None:
+        server = meta.getServer(server_id, _CTX)
+        if not server:
+            raise RuntimeError(f'getServer({server_id}) returned null — is virtual server {server_id} running?')
+        _server_cache[server_id] = server
+    return server
+
+
+def _typecheck(obj: dict, schema: dict[str, type]) -> None:
+    """Reject fields whose JSON type doesn't match the schema (absent fields are skipped)."""
+    for key, expected in schema.items():
+        if key in obj and type(obj[key]) is not expected:
+            raise TypeError(f"'{key}' must be {expected.__name__}, got {type(obj[key]).__name__}")
+
+
+_ACL_SCHEMA = {
+    'applyHere': bool,
+    'applySubs': bool,
+    'inherited': bool,
+    'userid': int,
+    'group': str,
+    'allow': int,
+    'deny': int,
+}
+
+
+def _register_user(server: MumbleServer.ServerPrx, params: dict) -> int:
+    _typecheck(params, {'username': str, 'password': str})
+    info = {
+        MumbleServer.UserInfo.UserName: params['username'],
+        MumbleServer.UserInfo.UserPassword: params['password'],
+    }
+    return server.registerUser(info, _CTX)
+
+
+def _unregister_user(server: MumbleServer.ServerPrx, params: dict) -> None:
+    _typecheck(params, {'userId': int})
+    server.unregisterUser(params['userId'], _CTX)
+
+
+def _update_registration(server: MumbleServer.ServerPrx, params: dict) -> None:
+    _typecheck(params, {'userId': int, 'updates': dict})
+    updates = params.get('updates', {})
+    _typecheck(updates, {'username': str, 'password': str})
+    info = {}
+    if 'username' in updates:
+        info[MumbleServer.UserInfo.UserName] = updates['username']
+    if 'password' in updates:
+        info[MumbleServer.UserInfo.UserPassword] = updates['password']
+    server.updateRegistration(params['userId'], info, _CTX)
+
+
+def _get_registered_users(server: MumbleServer.ServerPrx, params: dict) -> dict:
+    _typecheck(params, {'filter': str})
+    # Keys are integer Murmur user IDs — _dumps writes them as JSON string
+    # keys directly, so no intermediate str-keyed dict is built
+    return server.getRegisteredUsers(params.get('filter', ''), _CTX)
+
+
+def _set_acl(server: MumbleServer.ServerPrx, params: dict) -> None:
+    _typecheck(params, {'channelId': int, 'acls': list, 'inherit': bool})
+    entries = params.get('acls', [])
+    for a in entries:
+        _typecheck(a, _ACL_SCHEMA)
+    # Positional args follow the slice field order: applyHere, applySubs,
+    # inherited, userid, group, allow, deny
+    acls = [
+        MumbleServer.ACL(
+            a.get('applyHere', True),
+            a.get('applySubs', True),
+            a.get('inherited', False),
+            a.get('userid', -1),
+            a.get('group', ''),
+            a.get('allow', 0),
+            a.get('deny', 0),
+        )
+        for a in entries
+    ]
+    server.setACL(
+        params['channelId'],
+        acls,
+        [],  # no group definitions
+        params.get('inherit', True),
+        _CTX,
+    )
+
+
+def _get_acl(server: MumbleServer.ServerPrx, params: dict) -> dict:
+    _typecheck(params, {'channelId': int})
+    acls, groups, inherit = server.getACL(params['channelId'], _CTX)
+    return {
+        'acls': [
+            {
+                'applyHere': a.applyHere,
+                'applySubs': a.applySubs,
+                'inherited': a.inherited,
+                'userid': a.userid,
+                'group': a.group,
+                'allow': a.allow,
+                'deny': a.deny,
+            }
+            for a in acls
+        ],
+        'inherit': inherit,
+    }
+
+
+def _get_registration(server: MumbleServer.ServerPrx, params: dict) -> dict:
+    _typecheck(params, {'userId': int})
+    result = server.getRegistration(params['userId'], _CTX)
+    return {_USERINFO_NAMES.get(k.value, str(k)): v for k, v in result.items()}
+
+
+# JSON-RPC method name → handler(server, params)
+_HANDLERS = {
+    'registerUser': _register_user,
+    'unregisterUser': _unregister_user,
+    'updateRegistration': _update_registration,
+    'getRegisteredUsers': _get_registered_users,
+    'setACL': _set_acl,
+    'getACL': _get_acl,
+    'getRegistration': _get_registration,
+}
 
 
 def dispatch(server: MumbleServer.ServerPrx, method: str, params: dict) -> object:
     """Route a JSON-RPC method call to the corresponding Murmur ICE operation."""
+    handler = _HANDLERS.get(method)
+    if handler is None:
+        raise ValueError(f'Unknown method: {method}')
+    return handler(server, params)
+
+
+def read_lines(fd: int) -> Iterator[bytes]:
+    """Yield newline-delimited frames from a raw fd, many per read() when queued."""
+    buf = bytearray()
+    while True:
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        buf += chunk
+        while (nl := buf.find(b'\n')) >= 0:
+            line = bytes(buf[:nl])
+            del buf[:nl + 1]
+            yield line
+    if buf:
+        yield bytes(buf)
+
+
+def handle_request(server: MumbleServer.ServerPrx, req: dict) -> dict:
+    """Run a single request and build its response object (never raises)."""
+    req_id = ''
+    try:
+        req_id = req.get('id', '')
+        method = req.get('method', '')
+        params = req.get('params', {})
 
-    if method == 'registerUser':
-        info = {
-            MumbleServer.UserInfo.UserName: params['username'],
-            MumbleServer.UserInfo.UserPassword: params['password'],
-        }
-        user_id = server.registerUser(info)
-        return user_id  # integer
+        result = dispatch(server, method, params)
+        return {'id': req_id, 'result': result}
 
-    elif method == 'unregisterUser':
-        server.unregisterUser(int(params['userId']))
-        return None
+    except (MumbleServer.InvalidUserException, MumbleServer.InvalidChannelException) as e:
+        return {'id': req_id, 'error': f'Murmur: {type(e).__name__}'}
+    except MumbleServer.InvalidSecretException:
+        return {'id': req_id, 'error': 'Murmur: InvalidSecret — check MUMBLE_ICE_SECRET'}
+    except Exception as e:
+        return {'id': req_id, 'error': str(e)}
 
-    elif method == 'updateRegistration':
-        updates = params.get('updates', {})
-        info = {}
-        if 'username' in updates:
-            info[MumbleServer.UserInfo.UserName] = updates['username']
-        if 'password' in updates:
-            info[MumbleServer.UserInfo.UserPassword] = updates['password']
-        server.updateRegistration(int(params['userId']), info)
-        return None
 
-    elif method == 'getRegisteredUsers':
-        result = server.getRegisteredUsers(params.get('filter', ''))
-        # Keys are integer Murmur user IDs — JSON requires string keys
-        return {str(k): v for k, v in result.items()}
-
-    elif method == 'setACL':
-        acls = []
-        for a in params.get('acls', []):
-            acl = MumbleServer.ACL()
-            acl.applyHere = bool(a.get('applyHere', True))
-            acl.applySubs = bool(a.get('applySubs', True))
-            acl.inherited = bool(a.get('inherited', False))
-            acl.userid = int(a.get('userid', -1))
-            acl.group = str(a.get('group', ''))
-            acl.allow = int(a.get('allow', 0))
-            acl.deny = int(a.get('deny', 0))
-            acls.append(acl)
-        server.setACL(
-            int(params['channelId']),
-            acls,
-            [],  # no group definitions
-            bool(params.get('inherit', True)),
-        )
+def emit(obj: object) -> None:
+    """Write one response line to stdout (thread-safe)."""
+    # Pre-encoded bytes + newline in a single write, bypassing TextIOWrapper
+    line = _dumps(obj) + b'\n'
+    with _write_lock:
+        sys.stdout.buffer.write(line)
+        sys.stdout.buffer.flush()
+
+
+def encodable(response: dict) -> dict:
+    """Return the response, or an error reply with the same id if it can't be serialized."""
+    try:
+        _dumps(response)
+        return response
+    except Exception as e:
+        return {'id': response.get('id', ''), 'error': f'Failed to encode result: {e}'}
+
+
+def handle_line(server: MumbleServer.ServerPrx, line: bytes) -> None:
+    """Parse one stdin frame (single request or batch) and emit its response."""
+    req = parse_line(line)
+    if req is not None:
+        handle_job(server, req)
+
+
+def parse_line(line: bytes) -> object | None:
+    """Decode one stdin frame, replying with an error (and returning None) if it isn't JSON."""
+    try:
+        return _loads(line)
+    except Exception as e:
+        emit({'id': '', 'error': str(e)})
         return None
 
-    elif method == 'getACL':
-        acls, groups, inherit = server.getACL(int(params['channelId']))
-        return {
-            'acls': [
-                {
-                    'applyHere': a.applyHere,
-                    'applySubs': a.applySubs,
-                    'inherited': a.inherited,
-                    'userid': a.userid,
-                    'group': a.group,
-                    'allow': a.allow,
-                    'deny': a.deny,
-                }
-                for a in acls
-            ],
-            'inherit': inherit,
-        }
-
-    elif method == 'getRegistration':
-        result = server.getRegistration(int(params['userId']))
-        # Map UserInfo enum keys to readable string keys
-        name_map = {
-            0: 'UserName',
-            1: 'UserEmail',
-            2: 'UserComment',
-            3: 'UserHash',
-            4: 'UserPassword',
-            5: 'UserLastActive',
-            6: 'UserKDFIterations',
-        }
-        return {name_map.get(int(k), str(k)): v for k, v in result.items()}
 
+def handle_job(server: MumbleServer.ServerPrx, req: object) -> None:
+    """Dispatch a decoded frame (single request or batch) and emit its response."""
+    if isinstance(req, list):
+        # Batch — dispatch every sub-request, reply with one line
+        response = {'batch': [handle_request(server, r) for r in req]}
     else:
-        raise ValueError(f'Unknown method: {method}')
+        response = handle_request(server, req)
+
+    try:
+        emit(response)
+    except Exception:
+        # A result the encoder can't serialize — still answer (per sub-request
+        # for batches) so the caller doesn't wait forever on those ids
+        if 'batch' in response:
+            emit({'batch': [encodable(r) for r in response['batch']]})
+        else:
+            emit(encodable(response))
+
+
+# ── Write ordering ──
+# setACL / updateRegistration / unregisterUser replace state wholesale, so two
+# of them on the same channel or user must land in the order they were sent.
+# Such frames are routed to a fixed worker lane by hash(target); reads go to
+# whichever lane is shortest and still run in parallel.
+
+_ORDERED_BY = {
+    'setACL': 'channelId',
+    'updateRegistration': 'userId',
+    'unregisterUser': 'userId',
+}
+
+
+def ordering_keys(req: object) -> set[tuple[str, str]]:
+    """Targets of the order-sensitive writes in a frame, as (param, value) pairs."""
+    keys = set()
+    for r in req if isinstance(req, list) else [req]:
+        if not isinstance(r, dict):
+            continue
+        param = _ORDERED_BY.get(r.get('method'))
+        params = r.get('params')
+        if param and isinstance(params, dict):
+            keys.add((param, str(params.get(param))))
+    return keys
+
+
+class _Barrier:
+    """Holds a lane while a batch touching targets on several lanes runs on another."""
+
+    def __init__(self) -> None:
+        self.reached = threading.Event()
+        self.done = threading.Event()
+
+
+def route(lanes: list[queue.Queue], req: object) -> None:
+    """Queue a decoded frame on the lane(s) that own its write targets."""
+    keys = ordering_keys(req)
+    if not keys:
+        min(lanes, key=lambda q: q.qsize()).put((req, []))
+        return
+
+    # A batch may write targets owned by several lanes: run it on the first and
+    # park the others behind a barrier so nothing queued after it there can
+    # overtake it. Frames are enqueued by the single reader thread, so every
+    # lane sees barriers in the same order and they can't deadlock.
+    first, *rest = sorted({hash(k) % len(lanes) for k in keys})
+    barriers = [_Barrier() for _ in rest]
+    for i, barrier in zip(rest, barriers):
+        lanes[i].put(barrier)
+    lanes[first].put((req, barriers))
+
+
+def worker(server: MumbleServer.ServerPrx, jobs: queue.Queue) -> None:
+    """Handle frames from one lane until a None sentinel arrives."""
+    while (job := jobs.get()) is not None:
+        if isinstance(job, _Barrier):
+            job.reached.set()
+            job.done.wait()
+            continue
+
+        req, barriers = job
+        try:
+            for barrier in barriers:
+                barrier.reached.wait()
+            handle_job(server, req)
+        except Exception as e:
+            # Keep the thread alive — a dead worker silently shrinks the pool
+            print(f'[mumble-ice] Worker error: {e}', file=sys.stderr, flush=True)
+        finally:
+            for barrier in barriers:
+                barrier.done.set()
 
 
 def main() -> None:
@@ -147,42 +397,42 @@ def main() -> None:
 
     communicator = None
     try:
-        communicator = create_communicator(host, port, secret)
+        num_workers = max(1, int(os.environ.get('MUMBLE_ICE_WORKERS') or '4'))
+        if secret:
+            _CTX['secret'] = secret
+        communicator = create_communicator()
 
         base = communicator.stringToProxy(f'Meta:tcp -h {host} -p {port}')
-        meta = MumbleServer.MetaPrx.checkedCast(base)
+        meta = MumbleServer.MetaPrx.checkedCast(base, _CTX)
         if not meta:
             raise RuntimeError('Cannot cast ICE proxy to MumbleServer.Meta — wrong host/port?')
 
-        server = meta.getServer(1)
-        if not server:
-            raise RuntimeError('getServer(1) returned null — is virtual server 1 running?')
+        server = get_server(meta, 1)
+
+        # ICE proxies are thread-safe; workers multiplex calls over one
+        # connection, each draining its own lane (see route())
+        lanes: list[queue.Queue] = [queue.Queue() for _ in range(num_workers)]
+        workers = [
+            threading.Thread(target=worker, args=(server, jobs), daemon=True)
+            for jobs in lanes
+        ]
+        for t in workers:
+            t.start()
 
         # Signal to the TypeScript parent that ICE is connected and ready
-        print(json.dumps({'ready': True}), flush=True)
+        emit({'ready': True})
 
-        # Main command loop — read JSON lines from stdin
-        for line in sys.stdin:
+        # Main command loop — read JSON lines from stdin, hand them to workers
+        for line in read_lines(sys.stdin.buffer.fileno()):
             line = line.strip()
-            if not line:
-                continue
-
-            req_id = ''
-            try:
-                req = json.loads(line)
-                req_id = req.get('id', '')
-                method = req.get('method', '')
-                params = req.get('params', {})
-
-                result = dispatch(server, method, params)
-                print(json.dumps({'id': req_id, 'result': result}), flush=True)
-
-            except (MumbleServer.InvalidUserException, MumbleServer.InvalidChannelException) as e:
-                print(json.dumps({'id': req_id, 'error': f'Murmur: {type(e).__name__}'}), flush=True)
-            except MumbleServer.InvalidSecretException:
-                print(json.dumps({'id': req_id, 'error': 'Murmur: InvalidSecret — check MUMBLE_ICE_SECRET'}), flush=True)
-            except Exception as e:
-                print(json.dumps({'id': req_id, 'error': str(e)}), flush=True)
+            if line and (req := parse_line(line)) is not None:
+                route(lanes, req)
+
+        # stdin closed — let in-flight requests finish before tearing down ICE
+        for jobs in lanes:
+            jobs.put(None)
+        for t in workers:
+            t.join()
 
     except Exception as e:
         # Fatal startup error — print to stderr so TypeScript sees it, then exit
@@ -1,22 +1,47 @@
 #!/usr/bin/env python3
 """Thin faster-whisper wrapper for Quad processing module.
 
-Transcribes all .ogg/.flac files in a directory and outputs JSON to stdout.
-Progress and errors go to stderr.
+Transcribes all .ogg/.flac files in a directory and streams NDJSON to stdout:
+one {"track": <name>, "segments": [...], "language": ..., "duration": ...}
+line per file, written as soon as that file is done. Progress and errors go
+to stderr.
 
 Usage:
     python3 scripts/transcribe.py <audio_dir> [--model MODEL] [--language LANG] [--initial-prompt PROMPT]
+        [--workers N] [--compute-type TYPE]
 """
 
 import argparse
 import json
+import os
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
-from faster_whisper import WhisperModel
+import ctranslate2
+import numpy as np
+from faster_whisper import WhisperModel, decode_audio
 
+try:
+    import orjson
 
-def transcribe_file(model: WhisperModel, audio_path: str, language: str, initial_prompt: str) -> dict:
+    def _dumps(obj: object) -> bytes:
+        # faster-whisper can hand back numpy scalars (see transcribe_file)
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
+AUDIO_EXTENSIONS = {"ogg", "flac"}
+
+
+def decode_track(model: WhisperModel, path: Path) -> np.ndarray:
+    """Decode a file to the model's mono float32 waveform."""
+    return decode_audio(str(path), sampling_rate=model.feature_extractor.sampling_rate)
+
+
+def transcribe_file(model: WhisperModel, audio: np.ndarray, language: str, initial_prompt: str) -> dict:
     kwargs = dict(
         language=language,
         beam_size=5,
@@ -27,19 +52,28 @@ def transcribe_file(model: WhisperModel, audio_path: str, language: str, initial
     if initial_prompt:
         kwargs["initial_prompt"] = initial_prompt
 
-    segments, info = model.transcribe(audio_path, **kwargs)
+    segments, info = model.transcribe(audio, **kwargs)
 
     result_segments = []
     for seg in segments:
+        # With word_timestamps, segment start/end are copied from the words and
+        # come back as numpy.float64 — coerce to plain floats for the encoder
         entry = {
-            "start": round(seg.start, 3),
-            "end": round(seg.end, 3),
+            "start": round(float(seg.start), 3),
+            "end": round(float(seg.end), 3),
             "text": seg.text.strip(),
             "avg_logprob": round(seg.avg_logprob, 4),
         }
         if seg.words:
+            # Hot path (one entry per word): int(x * 10**n + 0.5) / 10**n rounds
+            # the non-negative timestamps/probabilities without round()'s call cost
             entry["words"] = [
-                {"start": round(w.start, 3), "end": round(w.end, 3), "word": w.word, "probability": round(w.probability, 4)}
+                {
+                    "start": int(w.start * 1000 + 0.5) / 1000,
+                    "end": int(w.end * 1000 + 0.5) / 1000,
+                    "word": w.word,
+                    "probability": int(w.probability * 10000 + 0.5) / 10000,
+                }
                 for w in seg.words
             ]
         result_segments.append(entry)
@@ -47,35 +81,92 @@ def transcribe_file(model: WhisperModel, audio_path: str, language: str, initial
     return {"segments": result_segments, "language": info.language, "duration": round(info.duration, 3)}
 
 
+def transcribe_track(
+    model: WhisperModel, name: str, path: Path, decoded: Future, language: str, initial_prompt: str
+) -> dict:
+    """Pool worker: transcribe one pre-decoded file, logging progress when the work actually runs."""
+    audio = decoded.result()
+    print(f"Transcribing {name} ({path.name})...", file=sys.stderr)
+    result = transcribe_file(model, audio, language, initial_prompt)
+    print(f"Finished {name} ({path.name})", file=sys.stderr)
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(description="Transcribe audio files with faster-whisper")
     parser.add_argument("audio_dir", help="Directory containing .ogg/.flac audio files")
     parser.add_argument("--model", default="small", help="Whisper model name (default: small)")
     parser.add_argument("--language", default="en", help="Language code (default: en)")
     parser.add_argument("--initial-prompt", default="", help="Initial prompt to bias vocabulary")
+    parser.add_argument(
+        "--compute-type",
+        default="auto",
+        help="CTranslate2 compute type (default: auto = int8_float16 on GPU, int8 on CPU)",
+    )
+    parser.add_argument("--workers", type=int, default=2, help="Files transcribed in parallel (default: 2)")
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     audio_path = Path(args.audio_dir)
     if not audio_path.is_dir():
         print(f"Error: {args.audio_dir} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    audio_files = sorted(audio_path.glob("*.ogg")) + sorted(audio_path.glob("*.flac"))
+    # Single directory pass, one sort by filename across both extensions
+    with os.scandir(audio_path) as it:
+        audio_files = sorted(
+            (Path(e.path) for e in it if e.is_file() and e.name.rsplit(".", 1)[-1].lower() in AUDIO_EXTENSIONS),
+            key=lambda p: p.name,
+        )
     if not audio_files:
         print(f"No .ogg or .flac files found in {args.audio_dir}", file=sys.stderr)
-        json.dump({"tracks": {}}, sys.stdout)
         sys.exit(0)
 
-    print(f"Loading model '{args.model}'...", file=sys.stderr)
-    model = WhisperModel(args.model, device="auto", compute_type="default")
-
-    tracks = {}
-    for f in audio_files:
-        name = f.stem.split("-", 1)[1] if "-" in f.stem and f.stem.split("-", 1)[0].isdigit() else f.stem
-        print(f"Transcribing {name} ({f.name})...", file=sys.stderr)
-        tracks[name] = transcribe_file(model, str(f), args.language, args.initial_prompt)
-
-    json.dump({"tracks": tracks}, sys.stdout)
+    compute_type = args.compute_type
+    if compute_type == "auto":
+        compute_type = "int8_float16" if ctranslate2.get_cuda_device_count() > 0 else "int8"
+
+    print(f"Loading model '{args.model}' ({compute_type})...", file=sys.stderr)
+    # num_workers lets CTranslate2 run concurrent transcribe() calls in parallel
+    model = WhisperModel(args.model, device="auto", compute_type=compute_type, num_workers=args.workers)
+
+    # A single decoder thread runs ahead of inference, so workers pick up
+    # waveforms that are already decoded; faster-whisper releases the GIL during
+    # inference, so decoding and VAD overlap with it. Tracks are emitted in input
+    # order, and only workers + 1 files are in flight so decoded audio and
+    # finished-but-unwritten results stay bounded instead of piling up behind
+    # a slow file.
+    with ThreadPoolExecutor(max_workers=1) as decoder, ThreadPoolExecutor(max_workers=args.workers) as pool:
+        remaining = iter(audio_files)
+        jobs = deque()
+
+        def submit_next() -> None:
+            f = next(remaining, None)
+            if f is None:
+                return
+            name = f.stem.split("-", 1)[1] if "-" in f.stem and f.stem.split("-", 1)[0].isdigit() else f.stem
+            decoded = decoder.submit(decode_track, model, f)
+            jobs.append((name, pool.submit(transcribe_track, model, name, f, decoded, args.language, args.initial_prompt)))
+
+        for _ in range(args.workers + 1):
+            submit_next()
+
+        out = sys.stdout.buffer
+        try:
+            while jobs:
+                name, job = jobs.popleft()
+                line = _dumps({"track": name, **job.result()}) + b"\n"
+                # Drop the Future (it keeps its result alive) before waiting on the next one
+                del job
+                out.write(line)
+                out.flush()
+                submit_next()
+        except BaseException:
+            # Fail fast: drop queued files instead of transcribing them all first
+            decoder.shutdown(cancel_futures=True)
+            pool.shutdown(cancel_futures=True)
+            raise
 
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@
  * Murmur ICE client — TypeScript wrapper around the Python ICE sidecar.
  *
  * Spawns `scripts/mumble-ice.py` as a long-lived subprocess and communicates
- * with it via JSON lines on stdin/stdout. The Python sidecar handles the ZeroC
+ * with it via JSON lines on stdin/stdout. Several calls can share one line as
+ * a batch (see `callBatch`). The Python sidecar handles the ZeroC
  * ICE protocol (zeroc-ice pip package + MumbleServer.ice slice).
  *
  * Why Python sidecar?
@@ -64,6 +65,13 @@ interface IceResponse {
   result?: unknown;
   error?: string;
   ready?: boolean;
+  /** Per-call responses for a batch request, in request order. */
+  batch?: IceResponse[];
+}
+
+interface IceBatchCall {
+  method: string;
+  params?: Record<string, unknown>;
 }
 
 const READY_TIMEOUT_MS = 15_000;
@@ -103,16 +111,14 @@ export class IceClient {
           return;
         }
 
-        if (resp.id === undefined) return;
-        const pending = this.pending.get(resp.id);
-        if (!pending) return;
-
-        this.pending.delete(resp.id);
-        if (resp.error) {
-          pending.reject(new Error(resp.error));
-        } else {
-          pending.resolve(resp.result);
+        if (resp.batch) {
+          for (const sub of resp.batch) {
+            this.settle(sub);
+          }
+          return;
         }
+
+        this.settle(resp);
       });
 
       this.proc.stderr!.on('data', (data: Buffer) => {
@@ -153,6 +159,20 @@ export class IceClient {
     });
   }
 
+  /** Resolve or reject the pending call a sidecar response belongs to. */
+  private settle(resp: IceResponse): void {
+    if (resp.id === undefined) return;
+    const pending = this.pending.get(resp.id);
+    if (!pending) return;
+
+    this.pending.delete(resp.id);
+    if (resp.error) {
+      pending.reject(new Error(resp.error));
+    } else {
+      pending.resolve(resp.result);
+    }
+  }
+
   private call<T>(method: string, params: Record<string, unknown> = {}): Promise<T> {
     if (!this.proc || !this.ready) {
       return Promise.reject(new Error('ICE client not connected'));
@@ -171,6 +191,37 @@ export class IceClient {
     });
   }
 
+  /**
+   * Send several calls to the sidecar as one batch line. The sidecar runs them
+   * in order and answers with a single line; one failing call does not abort
+   * the rest. Resolves to one settled result per call, in input order.
+   */
+  private callBatch<T>(calls: IceBatchCall[]): Promise<PromiseSettledResult<T>[]> {
+    if (!this.proc || !this.ready) {
+      // Fail each call individually, matching the settled-per-call contract
+      const reason = new Error('ICE client not connected');
+      return Promise.resolve(calls.map((): PromiseRejectedResult => ({ status: 'rejected', reason })));
+    }
+    if (calls.length === 0) {
+      return Promise.resolve([]);
+    }
+
+    const reqs: IceRequest[] = [];
+    const results = calls.map(({ method, params = {} }) => {
+      const id = String(this.nextId++);
+      reqs.push({ id, method, params });
+      return new Promise<T>((resolve, reject) => {
+        this.pending.set(id, {
+          resolve: (v) => resolve(v as T),
+          reject,
+        });
+      });
+    });
+
+    this.proc.stdin!.write(JSON.stringify(reqs) + '\n');
+    return Promise.allSettled(results);
+  }
+
   /**
    * Register a new Mumble user with a username and password.
    * Returns the Murmur user ID (integer, used in ACLs and cert pinning).
@@ -179,6 +230,18 @@ export class IceClient {
     return this.call<number>('registerUser', { username, password });
   }
 
+  /**
+   * Register several Mumble users in one sidecar round-trip.
+   * Returns one settled Murmur user ID per entry, in input order.
+   */
+  async registerUsers(
+    users: Array<{ username: string; password: string }>,
+  ): Promise<PromiseSettledResult<number>[]> {
+    return this.callBatch<number>(
+      users.map(({ username, password }) => ({ method: 'registerUser', params: { username, password } })),
+    );
+  }
+
   /** Remove a registered Mumble user. */
   async unregisterUser(userId: number): Promise<void> {
     await this.call('unregisterUser', { userId });
@@ -51,26 +51,30 @@ export class UserManager {
     const mumbleUsers: Record<string, MumbleUserEntry> = {};
     const registered: MumbleUserEntry[] = [];
 
-    for (const member of roster) {
-      if (!member.userId || !member.displayName) continue;
+    const members = roster
+      .filter((m) => m.userId && m.displayName)
+      .map((m) => ({ ...m, tempPassword: crypto.randomBytes(6).toString('base64url').slice(0, 8) }));
 
-      const tempPassword = crypto.randomBytes(6).toString('base64url').slice(0, 8);
+    // Register the whole roster in one batched round-trip to the ICE sidecar
+    const results = await this.iceClient.registerUsers(
+      members.map((m) => ({ username: m.displayName, password: m.tempPassword })),
+    );
 
-      let mumbleUserId: number;
-      try {
-        mumbleUserId = await this.iceClient.registerUser(member.displayName, tempPassword);
-      } catch (err) {
+    for (const [i, member] of members.entries()) {
+      const result = results[i];
+      if (result.status === 'rejected') {
         logger.error(`Failed to register Mumble user for ${member.displayName}`, {
           teamId,
-          error: String(err),
+          error: String(result.reason),
         });
         continue;
       }
 
+      const mumbleUserId = result.value;
       const entry: MumbleUserEntry = {
         mumbleUsername: member.displayName,
         mumbleUserId,
-        tempPassword,
+        tempPassword: member.tempPassword,
         certificatePinned: false,
         linkedAt: null,
       };
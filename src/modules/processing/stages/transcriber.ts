@@ -3,15 +3,16 @@
  * re-segments raw Whisper output into callout-sized chunks.
  */
 
-import { execFile } from 'node:child_process';
+import { spawn } from 'node:child_process';
 import { join } from 'node:path';
+import { createInterface } from 'node:readline';
 import { fileURLToPath } from 'node:url';
 import { logger } from '../../../core/logger.js';
 import { buildWhisperPrompt } from '../utils.js';
 import type { ProcessingConfig } from '../../../core/config.js';
 import type {
   TranscriptSegment,
-  RawWhisperOutput,
+  RawWhisperTrack,
   RawWhisperSegment,
   RawWhisperWord,
 } from '../types.js';
@@ -33,8 +34,9 @@ const DEFAULT_SILENCE_GAP_MS = 800;
 /**
  * Transcribe all audio files in a directory.
  *
- * Spawns the Python faster-whisper wrapper, collects its JSON output,
- * then re-segments each track by silence gaps between words.
+ * Spawns the Python faster-whisper wrapper and re-segments each track by
+ * silence gaps between words as soon as its NDJSON line arrives, so earlier
+ * tracks are processed while later ones are still being transcribed.
  *
  * @returns Map of player name to re-segmented transcript segments.
  */
@@ -62,18 +64,17 @@ export async function transcribeDirectory(
     mapName: mapName ?? '',
   });
 
-  const rawJson = await spawnPython(args);
-
-  let parsed: { tracks: Record<string, RawWhisperOutput> };
-  try {
-    parsed = JSON.parse(rawJson);
-  } catch {
-    throw new Error(`Failed to parse transcriber JSON output: ${rawJson.slice(0, 200)}`);
-  }
-
   const result: Record<string, TranscriptSegment[]> = {};
 
-  for (const [playerName, trackOutput] of Object.entries(parsed.tracks)) {
+  await spawnPython(args, (line) => {
+    let trackOutput: RawWhisperTrack;
+    try {
+      trackOutput = JSON.parse(line);
+    } catch {
+      throw new Error(`Failed to parse transcriber JSON output: ${line.slice(0, 200)}`);
+    }
+
+    const playerName = trackOutput.track;
     const segments = transcribeTrack(trackOutput.segments);
     result[playerName] = segments;
 
@@ -83,7 +84,7 @@ export async function transcribeDirectory(
       words: wordCount,
       duration: trackOutput.duration,
     });
-  }
+  });
 
   return result;
 }
@@ -170,22 +171,58 @@ function round4(n: number): number {
   return Math.round(n * 10000) / 10000;
 }
 
-function spawnPython(args: string[]): Promise<string> {
+/**
+ * Run the Python wrapper, calling onLine for each non-empty stdout line.
+ * Rejects if the process fails, times out, or onLine throws.
+ */
+function spawnPython(args: string[], onLine: (line: string) => void): Promise<void> {
   return new Promise((resolve, reject) => {
-    execFile('python3', args, { timeout: TRANSCRIBE_TIMEOUT_MS, maxBuffer: 100 * 1024 * 1024 }, (error, stdout, stderr) => {
-      if (stderr) {
-        // Python progress messages go to stderr — log them
-        for (const line of stderr.split('\n')) {
-          if (line.trim()) {
-            logger.debug(`[transcribe.py] ${line}`);
-          }
+    const proc = spawn('python3', args, { stdio: ['ignore', 'pipe', 'pipe'] });
+    let stderr = '';
+    let failure: Error | null = null;
+
+    const timer = setTimeout(() => {
+      failure = new Error(`transcribe.py timed out after ${TRANSCRIBE_TIMEOUT_MS}ms`);
+      proc.kill();
+    }, TRANSCRIBE_TIMEOUT_MS);
+
+    const rl = createInterface({ input: proc.stdout });
+    rl.on('line', (line) => {
+      if (!line.trim() || failure) return;
+      try {
+        onLine(line);
+      } catch (err) {
+        failure = err as Error;
+        proc.kill();
+      }
+    });
+
+    proc.stderr.on('data', (data: Buffer) => {
+      const text = data.toString();
+      stderr += text;
+      // Python progress messages go to stderr — log them
+      for (const line of text.split('\n')) {
+        if (line.trim()) {
+          logger.debug(`[transcribe.py] ${line}`);
         }
       }
-      if (error) {
-        reject(new Error(`transcribe.py failed: ${error.message}\nstderr: ${stderr}`));
-        return;
+    });
+
+    proc.on('error', (err) => {
+      clearTimeout(timer);
+      reject(new Error(`transcribe.py failed: ${err.message}\nstderr: ${stderr}`));
+    });
+
+    // 'close' fires after stdout is fully drained, so every line has been handled
+    proc.on('close', (code, signal) => {
+      clearTimeout(timer);
+      if (failure) {
+        reject(failure);
+      } else if (code !== 0) {
+        reject(new Error(`transcribe.py failed: exit code ${code ?? signal}\nstderr: ${stderr}`));
+      } else {
+        resolve();
       }
-      resolve(stdout);
     });
   });
 }
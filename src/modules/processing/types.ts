@@ -188,6 +188,11 @@ export interface RawWhisperOutput {
   duration: number;
 }
 
+/** One NDJSON line from the Python wrapper — a single track's raw output. */
+export interface RawWhisperTrack extends RawWhisperOutput {
+  track: string;
+}
+
 export interface RawWhisperSegment {
   start: number;
   end: number;